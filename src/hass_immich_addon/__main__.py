@@ -0,0 +1,6 @@
+"""
+Allow running the application with `python -m hass_immich_addon`.
+"""
+from .main import run
+
+run()
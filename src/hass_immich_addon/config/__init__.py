@@ -0,0 +1,62 @@
+"""
+Configuration management for the application.
+"""
+from dataclasses import replace
+from pathlib import Path
+from typing import Optional
+
+from .schema import AppConfig, ImmichConfig, PhotoFilters
+from .defaults import *
+from .env import load_env_config
+from .yaml_config import load_yaml_config, save_yaml_config
+from .cli import parse_args
+
+def load_config() -> AppConfig:
+    """
+    Load configuration from all sources in priority order:
+    1. Command line arguments (highest priority)
+    2. Environment variables
+    3. YAML config file
+    4. Default values (lowest priority)
+    """
+    # Parse command line arguments
+    args = parse_args()
+    
+    # Load base configuration from environment
+    config = load_env_config()
+    
+    # Try to load and merge YAML configuration
+    yaml_config = load_yaml_config(args.config)
+    if yaml_config:
+        # Update non-None values from YAML config
+        config = replace(
+            config,
+            immich=replace(
+                config.immich,
+                url=yaml_config.immich.url or config.immich.url,
+                api_key=yaml_config.immich.api_key or config.immich.api_key
+            ),
+            hass_img_path=yaml_config.hass_img_path or config.hass_img_path,
+            num_photos=yaml_config.num_photos or config.num_photos,
+            update_interval_minutes=yaml_config.update_interval_minutes or config.update_interval_minutes,
+            log_level=yaml_config.log_level or config.log_level,
+            filters=yaml_config.filters or config.filters,
+            max_image_dimension=yaml_config.max_image_dimension or config.max_image_dimension,
+            search_cache_ttl=yaml_config.search_cache_ttl or config.search_cache_ttl
+        )
+    
+    # Override with command line arguments
+    config = replace(
+        config,
+        immich=replace(
+            config.immich,
+            url=args.immich_url or config.immich.url,
+            api_key=args.immich_api_key or config.immich.api_key
+        ),
+        log_level=args.log_level or config.log_level
+    )
+    
+    # Validate final configuration
+    config.validate()
+    
+    return config 
\ No newline at end of file
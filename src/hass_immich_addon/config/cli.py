@@ -2,30 +2,22 @@
 Command line argument handling.
 """
 import argparse
+from functools import lru_cache
 from pathlib import Path
 from datetime import datetime
-from typing import Literal
-from .env import get_config_path
+from typing import Optional, Sequence
+from .env import get_config_path, parse_datetime as _parse_env_datetime
 
 def parse_datetime(value: str) -> datetime:
     """Parse datetime from ISO format string."""
     try:
-        return datetime.fromisoformat(value)
+        return _parse_env_datetime(value)
     except ValueError as e:
-        raise argparse.ArgumentTypeError(
-            f"Invalid datetime format. Expected ISO format (YYYY-MM-DD or YYYY-MM-DDTHH:MM:SS), got: {value}"
-        ) from e
+        raise argparse.ArgumentTypeError(str(e)) from e
 
-def parse_selector_type(value: str) -> Literal["random", "smart", "smart-rng"]:
-    """Parse and validate selector type."""
-    if value not in ["random", "smart", "smart-rng"]:
-        raise argparse.ArgumentTypeError(
-            f"Invalid selector type. Must be one of: random, smart, smart-rng. Got: {value}"
-        )
-    return value
-
-def parse_args() -> argparse.Namespace:
-    """Parse command line arguments."""
+@lru_cache(maxsize=1)
+def _build_parser() -> argparse.ArgumentParser:
+    """Build the command line argument parser once."""
     parser = argparse.ArgumentParser(
         description="Home Assistant Immich Photo Addon",
         formatter_class=argparse.ArgumentDefaultsHelpFormatter
@@ -68,7 +60,6 @@ def parse_args() -> argparse.Namespace:
 
     parser.add_argument(
         "--selector-type",
-        type=parse_selector_type,
         choices=["random", "smart", "smart-rng"],
         help="Override the selector type (random, smart, or smart-rng)"
     )
@@ -78,4 +69,13 @@ def parse_args() -> argparse.Namespace:
         help="Override the search query (required when selector-type is smart)"
     )
     
-    return parser.parse_args() 
\ No newline at end of file
+    return parser
+
+def parse_args(argv: Optional[Sequence[str]] = None) -> argparse.Namespace:
+    """
+    Parse command line arguments.
+    
+    Args:
+        argv: Arguments to parse instead of sys.argv
+    """
+    return _build_parser().parse_args(argv) 
\ No newline at end of file
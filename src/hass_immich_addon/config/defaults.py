@@ -18,4 +18,6 @@ PEOPLE_FILTER = None
 HASS_IMG_PATH = Path("/config/www/immich")
 NUM_PHOTOS = 10
 UPDATE_INTERVAL_MINUTES = 60
-LOG_LEVEL = "INFO" 
\ No newline at end of file
+LOG_LEVEL = "INFO"
+MAX_IMAGE_DIMENSION = None  # Keep converted photos at full resolution
+SEARCH_CACHE_TTL = 0  # Always send search requests 
\ No newline at end of file
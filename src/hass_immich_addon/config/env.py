@@ -0,0 +1,152 @@
+"""
+Environment variable configuration handling.
+"""
+import os
+from functools import lru_cache
+from pathlib import Path
+from typing import Dict, Mapping, Optional, Tuple
+from datetime import datetime
+
+# Use the C ISO 8601 parser when available
+try:
+    from ciso8601 import parse_datetime as _fast_iso
+except ImportError:
+    _fast_iso = datetime.fromisoformat
+
+from .defaults import *
+from .schema import ImmichConfig, PhotoFilters, AppConfig
+
+# Environment variables read by the application
+_KEYS = (
+    "CONFIG_PATH",
+    "IMMICH_URL",
+    "IMMICH_API_KEY",
+    "HASS_IMG_PATH",
+    "NUM_PHOTOS",
+    "UPDATE_INTERVAL_MINUTES",
+    "LOG_LEVEL",
+    "MAX_IMAGE_DIMENSION",
+    "SEARCH_CACHE_TTL",
+    "CITY_FILTER",
+    "PEOPLE_FILTER",
+    "TAKEN_AFTER",
+    "TAKEN_BEFORE",
+    "SELECTOR_TYPE",
+    "SEARCH_QUERY",
+)
+
+# Environment variables that define a filter set
+_FILTER_KEYS = (
+    "CITY_FILTER",
+    "PEOPLE_FILTER",
+    "TAKEN_AFTER",
+    "TAKEN_BEFORE",
+    "SELECTOR_TYPE",
+    "SEARCH_QUERY",
+)
+
+def _load_dotenv(path: Path = Path('.env')) -> None:
+    """Load KEY=VALUE lines from a .env file without overriding existing variables."""
+    if not path.exists():
+        return
+    for line in path.read_text().splitlines():
+        line = line.strip()
+        if not line or line.startswith('#') or '=' not in line:
+            continue
+        key, value = line.split('=', 1)
+        os.environ.setdefault(key.strip(), value.strip().strip('"').strip("'"))
+
+@lru_cache(maxsize=1)
+def _env_snapshot() -> Dict[str, str]:
+    """Load the .env file once and snapshot the application's environment variables."""
+    _load_dotenv()
+    return {key: os.environ[key] for key in _KEYS if key in os.environ}
+
+def get_config_path() -> Path:
+    """Get configuration file path from environment variable or default."""
+    config_path = _env_snapshot().get("CONFIG_PATH")
+    if config_path:
+        return Path(config_path)
+    return DEFAULT_CONFIG_PATH
+
+@lru_cache(maxsize=256)
+def _parse_iso(value: str) -> datetime:
+    """Parse an ISO format string, caching results for repeated values."""
+    return _fast_iso(value)
+
+def parse_datetime(value: Optional[str]) -> Optional[datetime]:
+    """Parse datetime from ISO format string."""
+    if not value:
+        return None
+    try:
+        return _parse_iso(value)
+    except ValueError as e:
+        raise ValueError(f"Invalid datetime format. Expected ISO format (YYYY-MM-DD or YYYY-MM-DDTHH:MM:SS), got: {value}") from e
+
+def get_int_env(env: Mapping[str, str], key: str, default: Optional[int]) -> Optional[int]:
+    """Get a positive integer from the environment, or the default if unset."""
+    value = env.get(key)
+    if value is None:
+        return default
+    try:
+        int_value = int(value)
+        if int_value <= 0:
+            raise ValueError(f"Environment variable '{key}' must be a positive integer")
+        return int_value
+    except ValueError:
+        raise ValueError(f"Environment variable '{key}' must be a valid positive integer, got '{value}'")
+
+def get_list_env(env: Mapping[str, str], key: str) -> Optional[Tuple[str, ...]]:
+    """Get a tuple from a comma-separated environment variable, or None if unset."""
+    value = env.get(key)
+    if not value:
+        return None
+    return tuple(item.strip() for item in value.split(",") if item.strip())
+
+def load_env_config() -> AppConfig:
+    """Load configuration from environment variables."""
+    env = _env_snapshot()
+    
+    # Load Immich configuration
+    immich_config = ImmichConfig(
+        url=env.get("IMMICH_URL"),
+        api_key=env.get("IMMICH_API_KEY")
+    )
+    
+    # Create a single filter set from environment variables if any are set
+    filters = []
+    if any(env.get(key) for key in _FILTER_KEYS):
+        filters.append(PhotoFilters(
+            name="Filter from Environment Variables",
+            selector_type=env.get("SELECTOR_TYPE", "random"),
+            search_query=env.get("SEARCH_QUERY"),
+            city=env.get("CITY_FILTER", CITY_FILTER),
+            people=get_list_env(env, "PEOPLE_FILTER"),
+            taken_after=parse_datetime(env.get("TAKEN_AFTER")),
+            taken_before=parse_datetime(env.get("TAKEN_BEFORE"))
+        ))
+    else:
+        # Add default filter if no environment variables are set
+        filters.append(PhotoFilters(
+            name="default",
+            selector_type="random",
+            search_query=None,
+            city=CITY_FILTER,
+            people=PEOPLE_FILTER,
+            taken_after=None,
+            taken_before=None
+        ))
+    
+    # Create and return full configuration
+    config = AppConfig(
+        immich=immich_config,
+        hass_img_path=Path(env.get("HASS_IMG_PATH", HASS_IMG_PATH)),
+        num_photos=get_int_env(env, "NUM_PHOTOS", NUM_PHOTOS),
+        update_interval_minutes=get_int_env(env, "UPDATE_INTERVAL_MINUTES", UPDATE_INTERVAL_MINUTES),
+        log_level=env.get("LOG_LEVEL", LOG_LEVEL),
+        filters=tuple(filters),
+        max_image_dimension=get_int_env(env, "MAX_IMAGE_DIMENSION", MAX_IMAGE_DIMENSION),
+        search_cache_ttl=get_int_env(env, "SEARCH_CACHE_TTL", SEARCH_CACHE_TTL)
+    )
+    
+    return config 
\ No newline at end of file
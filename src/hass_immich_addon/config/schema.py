@@ -0,0 +1,188 @@
+"""
+Configuration schema and validation.
+"""
+from dataclasses import dataclass
+from typing import Optional, Literal, Set, Tuple
+from pathlib import Path
+import logging
+import os
+from datetime import datetime
+
+# Valid logging level names
+_VALID_LOG_LEVELS = frozenset(logging._nameToLevel.keys())
+
+# Directories already validated by this process, keyed by (path, inode, mtime)
+_validated: Set[Tuple[str, int, int]] = set()
+
+# Configurations already validated by this process
+_validated_configs: Set["AppConfig"] = set()
+
+def _directory_key(path: Path) -> Optional[Tuple[str, int, int]]:
+    """Get the cache key for a directory, or None if it does not exist."""
+    try:
+        s = os.stat(path)
+    except FileNotFoundError:
+        return None
+    return (str(path), s.st_ino, s.st_mtime_ns)
+
+def ensure_directory_exists(path: Path) -> None:
+    """
+    Create a directory if it doesn't exist, skipping paths already validated.
+    
+    Args:
+        path: Directory to create
+        
+    Raises:
+        ValueError: If the parent directory does not exist
+    """
+    key = _directory_key(path)
+    if key in _validated:
+        return
+        
+    # Only fall back to mkdir, which walks every path segment, when needed
+    if not os.path.isdir(path):
+        if not path.parent.exists():
+            raise ValueError(f"Parent directory does not exist: {path.parent}")
+        path.mkdir(parents=True, exist_ok=True)
+        key = _directory_key(path)
+    
+    _validated.add(key)
+
+@dataclass(frozen=True, slots=True)
+class ImmichConfig:
+    """Immich-specific configuration."""
+    url: Optional[str] = None
+    api_key: Optional[str] = None
+    
+    def validate(self) -> None:
+        """Validate Immich configuration."""
+        if not self.url:
+            raise ValueError("Immich URL is required but was not provided in any configuration source")
+        if not self.api_key:
+            raise ValueError("Immich API key is required but was not provided in any configuration source")
+        if not self.url.startswith(("http://", "https://")):
+            raise ValueError("Immich URL must start with http:// or https://")
+
+@dataclass(frozen=True, slots=True)
+class PhotoFilters:
+    """Configuration for photo filtering."""
+    name: str
+    selector_type: Literal["random", "smart", "smart-rng"] = "random"
+    search_query: Optional[str] = None
+    max_search_results: Optional[int] = None
+    city: Optional[str] = None
+    people: Optional[Tuple[str, ...]] = None
+    taken_after: Optional[datetime] = None
+    taken_before: Optional[datetime] = None
+
+    def validate(self) -> None:
+        """Validate filter configuration."""
+        try:
+            validator = _FILTER_VALIDATORS[self.selector_type]
+        except KeyError:
+            raise ValueError(f"Invalid selector type: {self.selector_type}") from None
+        validator(self)
+
+    def __str__(self) -> str:
+        """Return a human-readable string representation."""
+        parts = [f"Filter set '{self.name}' using {self.selector_type} selector"]
+        if self.search_query:
+            parts.append(f'searching for "{self.search_query}"')
+        if self.city:
+            parts.append(f"in {self.city}")
+        if self.people:
+            parts.append(f"with people {', '.join(self.people)}")
+        if self.taken_after or self.taken_before:
+            date_parts = []
+            if self.taken_after:
+                date_parts.append(f"after {self.taken_after.isoformat()}")
+            if self.taken_before:
+                date_parts.append(f"before {self.taken_before.isoformat()}")
+            parts.append(" and ".join(date_parts))
+        return " ".join(parts)
+
+def _validate_random(f: PhotoFilters) -> None:
+    """Validate a filter set using the random selector."""
+    if f.search_query:
+        raise ValueError("search_query should not be set when using random selector")
+    if f.max_search_results is not None:
+        raise ValueError("max_search_results can only be set when using smart-rng selector")
+
+def _validate_smart(f: PhotoFilters) -> None:
+    """Validate a filter set using the smart selector."""
+    if not f.search_query:
+        raise ValueError("search_query is required when using smart or smart-rng selector")
+    if f.max_search_results is not None:
+        raise ValueError("max_search_results can only be set when using smart-rng selector")
+
+def _validate_smart_rng(f: PhotoFilters) -> None:
+    """Validate a filter set using the smart-rng selector."""
+    if not f.search_query:
+        raise ValueError("search_query is required when using smart or smart-rng selector")
+    if f.max_search_results is not None:
+        if f.max_search_results <= 0 or f.max_search_results > 1000:
+            raise ValueError("max_search_results must be between 1 and 1000 (Immich limit)")
+
+# Filter validation for each selector type
+_FILTER_VALIDATORS = {
+    "random": _validate_random,
+    "smart": _validate_smart,
+    "smart-rng": _validate_smart_rng,
+}
+
+@dataclass(frozen=True, slots=True)
+class AppConfig:
+    """Application configuration."""
+    immich: ImmichConfig
+    hass_img_path: Path
+    num_photos: int
+    update_interval_minutes: int
+    log_level: str
+    filters: Tuple[PhotoFilters, ...]  # Now a sequence of filter sets
+    max_image_dimension: Optional[int] = None  # Maximum longest side of converted photos
+    search_cache_ttl: int = 0  # Seconds to reuse identical search responses, 0 to disable
+
+    def validate(self) -> None:
+        """
+        Validate the configuration after all sources have been loaded.
+        Raises ValueError if any required fields are missing or invalid.
+        """
+        # Identical configurations only need their image directory rechecked
+        if self in _validated_configs:
+            ensure_directory_exists(self.hass_img_path)
+            return
+        
+        # Validate Immich configuration
+        self.immich.validate()
+        
+        # Validate log level
+        if self.log_level.upper() not in _VALID_LOG_LEVELS:
+            raise ValueError(f"Invalid log level: {self.log_level}")
+        
+        # Validate numeric values
+        if self.num_photos <= 0:
+            raise ValueError("num_photos must be positive")
+        if self.update_interval_minutes <= 0:
+            raise ValueError("update_interval_minutes must be positive")
+        if self.max_image_dimension is not None and self.max_image_dimension <= 0:
+            raise ValueError("max_image_dimension must be positive")
+        if self.search_cache_ttl < 0:
+            raise ValueError("search_cache_ttl must not be negative")
+            
+        # Validate paths and create image directory if it doesn't exist
+        ensure_directory_exists(self.hass_img_path)
+        
+        # Validate filters
+        if not self.filters:
+            raise ValueError("At least one filter set must be configured")
+        
+        # Validate filter names are unique
+        filter_names = [f.name for f in self.filters]
+        if len(filter_names) != len(set(filter_names)):
+            raise ValueError("Filter set names must be unique")
+            
+        # Validate each filter's configuration
+        for f in self.filters:
+            f.validate()
+        
+        _validated_configs.add(self) 
\ No newline at end of file
@@ -0,0 +1,201 @@
+"""
+YAML configuration file handling.
+"""
+import json
+from pathlib import Path
+from typing import Dict, Any, List, Optional, Tuple
+from datetime import date, datetime, time
+import yaml
+
+from ..utils.file_utils import open_atomic
+
+from .defaults import *
+from .schema import ImmichConfig, PhotoFilters, AppConfig
+from .env import parse_datetime
+
+# Prefer the libyaml-backed loader/dumper when PyYAML was built with it
+Loader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+Dumper = getattr(yaml, "CSafeDumper", yaml.SafeDumper)
+
+def _cache_path(config_path: Path) -> Path:
+    """Get the path of the JSON cache file for a YAML config file."""
+    return config_path.with_suffix(config_path.suffix + ".cache.json")
+
+def _encode_cached(value: Any) -> Any:
+    """Encode YAML values JSON can't represent, tagged so _decode_cached can restore them."""
+    if isinstance(value, datetime):
+        return {"__datetime__": value.isoformat()}
+    if isinstance(value, date):
+        return {"__date__": value.isoformat()}
+    raise TypeError(f"Cannot cache value of type {type(value).__name__}")
+
+def _decode_cached(obj: Dict[str, Any]) -> Any:
+    """Restore values encoded by _encode_cached."""
+    if len(obj) == 1:
+        if "__datetime__" in obj:
+            return datetime.fromisoformat(obj["__datetime__"])
+        if "__date__" in obj:
+            return date.fromisoformat(obj["__date__"])
+    return obj
+
+def _load_cached(config_path: Path) -> Any:
+    """
+    Load the raw YAML document, using a JSON sidecar cache when it is current.
+    
+    The cache's first line is a header recording the mtime and size of the YAML
+    file it was built from; the rest is the parsed document as JSON, with dates
+    and timestamps tagged so they load back as the same objects YAML produced.
+    """
+    stat = config_path.stat()
+    header = {"mtime": stat.st_mtime_ns, "size": stat.st_size}
+    cache_path = _cache_path(config_path)
+    
+    try:
+        with open(cache_path, 'rb') as f:
+            if json.loads(f.readline()) == header:
+                return json.loads(f.read(), object_hook=_decode_cached)
+    except (OSError, ValueError):
+        pass  # Missing or corrupt cache, fall back to parsing the YAML
+    
+    yaml_config = yaml.load(config_path.read_bytes(), Loader=Loader)
+    
+    # Write the cache atomically; a read-only config directory is not an error
+    try:
+        text = json.dumps(header) + "\n" + json.dumps(yaml_config, default=_encode_cached)
+        with open_atomic(cache_path, 'w') as f:
+            f.write(text)
+    except (OSError, TypeError, ValueError):
+        pass
+    
+    return yaml_config
+
+def load_yaml_config(config_path: Path) -> AppConfig:
+    """Load configuration from YAML file."""
+    if not config_path.exists():
+        return None
+        
+    yaml_config = _load_cached(config_path)
+    
+    if not yaml_config:
+        return None
+        
+    # Extract Immich configuration
+    immich_section = yaml_config.get('immich', {})
+    immich_config = ImmichConfig(
+        url=immich_section.get('url', IMMICH_URL),
+        api_key=immich_section.get('api_key', IMMICH_API_KEY)
+    )
+    
+    # Extract filter configurations
+    filters: List[PhotoFilters] = []
+    filters_section = yaml_config.get('filters', [])
+    
+    # Helper function to parse dates from YAML
+    def parse_yaml_date(date_str: Any) -> Optional[datetime]:
+        if not date_str:
+            return None
+        try:
+            # Unquoted YAML timestamps and dates are already parsed by the loader
+            if isinstance(date_str, datetime):
+                return date_str
+            if isinstance(date_str, date):
+                return datetime.combine(date_str, time())
+            return parse_datetime(date_str)
+        except ValueError as e:
+            raise ValueError(f"Invalid date format in YAML: {e}")
+    
+    # Helper function to parse people lists from YAML into tuples
+    def parse_yaml_people(people: Optional[List[str]]) -> Optional[Tuple[str, ...]]:
+        if not people:
+            return None
+        return tuple(people)
+    
+    # Handle both single filter (old format) and multiple filters (new format)
+    if isinstance(filters_section, dict):
+        # Single filter set (legacy format)
+        filters.append(PhotoFilters(
+            name="default",
+            selector_type=filters_section.get('selector_type', 'random'),
+            search_query=filters_section.get('search_query'),
+            city=filters_section.get('city', CITY_FILTER),
+            people=parse_yaml_people(filters_section.get('people', PEOPLE_FILTER)),
+            taken_after=parse_yaml_date(filters_section.get('taken_after')),
+            taken_before=parse_yaml_date(filters_section.get('taken_before'))
+        ))
+    elif isinstance(filters_section, list):
+        # Multiple filter sets
+        filters = [
+            PhotoFilters(
+                name=filter_config.get('name', f"filter-{idx+1}"),
+                selector_type=filter_config.get('selector_type', 'random'),
+                search_query=filter_config.get('search_query'),
+                city=filter_config.get('city'),
+                people=parse_yaml_people(filter_config.get('people')),
+                taken_after=parse_yaml_date(filter_config.get('taken_after')),
+                taken_before=parse_yaml_date(filter_config.get('taken_before'))
+            )
+            for idx, filter_config in enumerate(filters_section)
+            if isinstance(filter_config, dict)
+        ]
+    
+    # If no filters were configured, add a default one
+    if not filters:
+        filters.append(PhotoFilters(
+            name="default",
+            city=CITY_FILTER,
+            people=PEOPLE_FILTER,
+            taken_after=None,
+            taken_before=None
+        ))
+    
+    # Create full configuration
+    config = AppConfig(
+        immich=immich_config,
+        hass_img_path=Path(yaml_config.get('hass_img_path', HASS_IMG_PATH)),
+        num_photos=yaml_config.get('num_photos', NUM_PHOTOS),
+        update_interval_minutes=yaml_config.get('update_interval_minutes', UPDATE_INTERVAL_MINUTES),
+        log_level=yaml_config.get('log_level', LOG_LEVEL),
+        filters=tuple(filters),
+        max_image_dimension=yaml_config.get('max_image_dimension', MAX_IMAGE_DIMENSION),
+        search_cache_ttl=yaml_config.get('search_cache_ttl', SEARCH_CACHE_TTL)
+    )
+    
+    return config
+
+def save_yaml_config(config: AppConfig, config_path: Path) -> None:
+    """Save configuration to YAML file."""
+    yaml_config = {
+        'immich': {
+            'url': config.immich.url,
+            'api_key': config.immich.api_key
+        },
+        'hass_img_path': str(config.hass_img_path),
+        'num_photos': config.num_photos,
+        'update_interval_minutes': config.update_interval_minutes,
+        'log_level': config.log_level,
+        'filters': [
+            # Only write the filter fields that are set
+            {
+                key: value
+                for key, value in (
+                    ('name', f.name),
+                    ('selector_type', f.selector_type),
+                    ('search_query', f.search_query),
+                    ('city', f.city),
+                    ('people', list(f.people) if f.people else None),
+                    ('taken_after', f.taken_after),
+                    ('taken_before', f.taken_before)
+                )
+                if value is not None
+            }
+            for f in config.filters
+        ]
+    }
+    if config.max_image_dimension:
+        yaml_config['max_image_dimension'] = config.max_image_dimension
+    if config.search_cache_ttl:
+        yaml_config['search_cache_ttl'] = config.search_cache_ttl
+    
+    text = yaml.dump(yaml_config, Dumper=Dumper, default_flow_style=False, sort_keys=False)
+    with open_atomic(config_path, 'w') as f:
+        f.write(text)
\ No newline at end of file
@@ -0,0 +1,383 @@
+"""
+Immich API client for interacting with Immich photo server.
+"""
+import asyncio
+import logging
+import mimetypes
+import os
+import sys
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from email.message import Message
+from typing import Any, Dict, List, Optional, Tuple
+import httpx
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from .immich_api import ImmichAPI, JSON_HEADERS, json_dumps, json_loads
+from .selectors import AssetSelector
+from ..utils.file_utils import cleanup_directory, open_atomic
+
+logger = logging.getLogger(__name__)
+
+# Chunk size used when copying downloaded files
+COPY_BUFFER_SIZE = 1 << 20
+
+# Write buffer for files receiving streamed downloads
+WRITE_BUFFER_SIZE = 1 << 21
+
+# Maximum number of original files downloaded at once
+DOWNLOAD_CONCURRENCY = 8
+
+# Transient statuses retried by AsyncImmichClient, matching create_session's
+# Retry policy so searches and downloads ride out a restarting server too
+RETRY_STATUSES = frozenset({502, 503, 504})
+RETRY_TOTAL = 3
+RETRY_BACKOFF_FACTOR = 0.2
+
+# Hidden subdirectory of the download directory holding partial downloads
+PARTIAL_DIR = ".partial"
+
+def _download_extension(headers: httpx.Headers) -> str:
+    """
+    Get the lowercase file extension for a downloaded asset from its response headers.
+    
+    Uses the filename in Content-Disposition, falling back to the extension
+    registered for the Content-Type.
+    
+    Args:
+        headers: Response headers of the download
+        
+    Returns:
+        Extension including the leading dot, or an empty string if unknown
+    """
+    content_disposition = headers.get("content-disposition")
+    if content_disposition:
+        message = Message()
+        message["content-disposition"] = content_disposition
+        ext = os.path.splitext(message.get_filename() or "")[1]
+        if ext:
+            return ext.lower()
+            
+    content_type = headers.get("content-type", "").partition(";")[0].strip()
+    return (mimetypes.guess_extension(content_type) or "").lower() if content_type else ""
+
+def create_session(api_key: str) -> requests.Session:
+    """
+    Create a session for talking to Immich with pooled connections and retries.
+    
+    Sessions handed to ImmichAPI and the asset selectors should come from here
+    so they get the same pool size and retry behaviour as ImmichClient.
+    
+    Args:
+        api_key: Immich API key sent with every request
+        
+    Returns:
+        Configured session
+    """
+    session = requests.Session()
+    session.headers.update({
+        "x-api-key": api_key,
+        "Accept": "application/json",
+        "Content-Type": "application/json"
+    })
+    
+    # Share keep-alive connections across requests and retry transient 5xx errors.
+    # Search and download POSTs only read data, so they are safe to retry.
+    adapter = HTTPAdapter(
+        pool_connections=10,
+        pool_maxsize=50,
+        max_retries=Retry(
+            total=3,
+            backoff_factor=0.2,
+            status_forcelist=[502, 503, 504],
+            allowed_methods=frozenset({"GET", "POST"})
+        )
+    )
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    return session
+
+@dataclass
+class ImmichConfig:
+    """Configuration for Immich client."""
+    url: str
+    api_key: str
+    
+    def __post_init__(self):
+        """Ensure URL doesn't end with a slash."""
+        self.url = self.url.rstrip('/')
+
+@dataclass
+class Asset:
+    """Represents an Immich asset (photo)."""
+    id: str
+    filename: str
+    thumbnail_url: str
+
+class ImmichClient:
+    """
+    Client for interacting with Immich API.
+    
+    Prefer ImmichClient.shared() so every component talking to the same server
+    uses one session, and therefore one connection pool, and one people cache.
+    The ImmichSession handed to ImmichAPI and the selectors should be the shared
+    client's session.
+    """
+    
+    _shared: Dict[Tuple[str, str], 'ImmichClient'] = {}
+    
+    def __init__(self, config: ImmichConfig, asset_selector: Optional[AssetSelector] = None):
+        """
+        Initialize the client with configuration and asset selector.
+        
+        Args:
+            config: ImmichConfig instance with connection details
+            asset_selector: Strategy for selecting assets from Immich
+        """
+        self.config = config
+        self.asset_selector = asset_selector
+        self.session = create_session(config.api_key)
+        self.api = ImmichAPI(self.session, config.url)
+
+    @classmethod
+    def shared(cls, config: ImmichConfig) -> 'ImmichClient':
+        """
+        Get the shared client for an Immich server, creating it on first use.
+        
+        Args:
+            config: ImmichConfig instance with connection details
+            
+        Returns:
+            The client shared by all callers with the same URL and API key
+        """
+        key = (config.url, config.api_key)
+        client = cls._shared.get(key)
+        if client is None:
+            client = cls._shared[key] = cls(config)
+        return client
+
+    def get_assets(self, count: int = 5) -> List[str]:
+        """
+        Get asset IDs using the configured selector strategy.
+        
+        Args:
+            count: Number of assets to retrieve
+            
+        Returns:
+            List of asset IDs
+            
+        Raises:
+            requests.RequestException: If the API request fails
+        """
+        return self.asset_selector.get_assets(count)
+
+    def get_assets_multi(self, selectors: List[AssetSelector], counts: List[int]) -> List[List[str]]:
+        """
+        Get asset IDs from several selectors concurrently.
+        
+        Requests release the GIL while waiting on the network, so running each
+        selector in its own thread brings the total wait down to roughly the
+        slowest request. Selectors should share this client's session.
+        
+        Args:
+            selectors: Strategies to select assets with
+            counts: Number of assets to retrieve from each selector
+            
+        Returns:
+            List of asset IDs for each selector, in the same order
+            
+        Raises:
+            requests.RequestException: If any API request fails
+        """
+        if not selectors:
+            return []
+            
+        with ThreadPoolExecutor(max_workers=min(8, len(selectors))) as executor:
+            return list(executor.map(lambda selector, count: selector.get_assets(count), selectors, counts))
+
+class AsyncImmichClient:
+    """
+    Non-blocking client for interacting with Immich API.
+    
+    Requests go over HTTP/2 when the server supports it, so several selectors
+    sharing one instance multiplex their searches over a single connection.
+    Like sessions from create_session, it retries 502, 503 and 504 responses.
+    Use it as an async context manager, or call close() when done, so pooled
+    connections are released.
+    """
+    
+    def __init__(self, config: ImmichConfig):
+        """
+        Initialize the client with configuration.
+        
+        Args:
+            config: ImmichConfig instance with connection details
+        """
+        self.config = config
+        self._client = httpx.AsyncClient(
+            http2=True,
+            headers={
+                "x-api-key": config.api_key,
+                "Accept": "application/json"
+            },
+            timeout=30.0,
+            limits=httpx.Limits(max_connections=20, max_keepalive_connections=20)
+        )
+
+    async def __aenter__(self) -> 'AsyncImmichClient':
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        await self.close()
+
+    async def close(self) -> None:
+        """Close the underlying client and its connections."""
+        await self._client.aclose()
+
+    async def _send(self, request: httpx.Request, stream: bool = False) -> httpx.Response:
+        """
+        Send a request, retrying transient 5xx responses with exponential backoff.
+        
+        Args:
+            request: Request to send
+            stream: Leave the response body unread; the caller must close it
+            
+        Returns:
+            Response to the last attempt, whatever its status
+            
+        Raises:
+            httpx.HTTPError: If the request cannot be sent
+        """
+        for retry in range(RETRY_TOTAL + 1):
+            response = await self._client.send(request, stream=stream)
+            if response.status_code not in RETRY_STATUSES or retry == RETRY_TOTAL:
+                return response
+                
+            await response.aclose()
+            delay = RETRY_BACKOFF_FACTOR * (2 ** retry)
+            logger.warning(f"{request.method} {request.url} returned {response.status_code}, retrying in {delay:.1f}s")
+            await asyncio.sleep(delay)
+
+    async def post_json(self, url: str, body: Any) -> Any:
+        """
+        POST a JSON body to the Immich API and parse the JSON response.
+        
+        Args:
+            url: Full URL of the API endpoint
+            body: Request body to serialize as JSON
+            
+        Returns:
+            Parsed response body
+            
+        Raises:
+            httpx.HTTPError: If the API request fails
+        """
+        request = self._client.build_request("POST", url, content=json_dumps(body), headers=JSON_HEADERS)
+        response = await self._send(request)
+        response.raise_for_status()
+        return json_loads(response.content)
+
+    async def get_assets(self, selector: AssetSelector, count: int = 5) -> List[str]:
+        """
+        Get asset IDs using the given selector strategy.
+        
+        Args:
+            selector: Strategy for selecting assets from Immich
+            count: Number of assets to retrieve
+            
+        Returns:
+            List of asset IDs
+            
+        Raises:
+            httpx.HTTPError: If the API request fails
+        """
+        return await selector.get_assets_async(self, count)
+
+    async def download_original(self, asset_id: str, directory: str) -> str:
+        """
+        Download an asset's original file into a directory.
+        
+        The file is named after the asset ID, keeping the extension of the
+        original filename (or of its content type) so it can be processed by
+        type. It is written atomically, so an interrupted download never leaves
+        a truncated file under the final name. All disk I/O runs in worker
+        threads so slow storage does not stall the event loop.
+        
+        Args:
+            asset_id: ID of the asset to download
+            directory: Directory where the file should be written
+            
+        Returns:
+            Path to the written file
+            
+        Raises:
+            OSError: If the file cannot be written
+            httpx.HTTPError: If the download fails
+        """
+        request = self._client.build_request(
+            "GET",
+            f"{self.config.url}/api/assets/{asset_id}/original",
+            headers={"Accept": "application/octet-stream"}
+        )
+        response = await self._send(request, stream=True)
+        try:
+            response.raise_for_status()
+            ext = _download_extension(response.headers)
+            path = os.path.join(directory, asset_id + ext)
+            
+            # The partial file lives in a hidden subdirectory so the folder
+            # sensor watching `directory` never picks it up.
+            writer = open_atomic(path, tmp_dir=os.path.join(directory, PARTIAL_DIR),
+                                 buffering=WRITE_BUFFER_SIZE)
+            f = await asyncio.to_thread(writer.__enter__)
+            try:
+                async for chunk in response.aiter_bytes(COPY_BUFFER_SIZE):
+                    await asyncio.to_thread(f.write, chunk)
+            except BaseException:
+                await asyncio.to_thread(writer.__exit__, *sys.exc_info())
+                raise
+            await asyncio.to_thread(writer.__exit__, None, None, None)
+        finally:
+            await response.aclose()
+            
+        return path
+
+    async def download_assets_parallel(self, asset_ids: List[str], directory: str,
+                                       max_concurrency: int = DOWNLOAD_CONCURRENCY) -> List[str]:
+        """
+        Download assets' original files concurrently.
+        
+        Downloads share the client's connections, multiplexed over HTTP/2 when
+        the server supports it.
+        A download that fails is logged and left out of the result.
+        
+        Args:
+            asset_ids: List of asset IDs to download
+            directory: Directory where the files should be written
+            max_concurrency: Maximum number of downloads in flight at once
+            
+        Returns:
+            Paths to the downloaded files
+        """
+        # Start from an empty partial directory; anything left in it is from
+        # an interrupted earlier run.
+        partial_dir = os.path.join(directory, PARTIAL_DIR)
+        await asyncio.to_thread(os.makedirs, partial_dir, exist_ok=True)
+        await asyncio.to_thread(cleanup_directory, partial_dir)
+        
+        semaphore = asyncio.Semaphore(max_concurrency)
+        
+        async def download(asset_id: str) -> Optional[str]:
+            async with semaphore:
+                try:
+                    return await self.download_original(asset_id, directory)
+                except (httpx.HTTPError, OSError) as e:
+                    logger.error(f"Failed to download asset {asset_id}: {e}", exc_info=True)
+                    return None
+                    
+        results = await asyncio.gather(*(download(asset_id) for asset_id in asset_ids))
+        paths = [path for path in results if path is not None]
+        
+        logger.info(f"Successfully downloaded {len(paths)} of {len(asset_ids)} assets to {directory}")
+        return paths
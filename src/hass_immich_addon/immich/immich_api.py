@@ -0,0 +1,228 @@
+"""
+Common utilities for interacting with the Immich API.
+"""
+from pathlib import Path
+from typing import Any, Dict, Optional, Protocol, Tuple
+import logging
+import time
+from urllib.parse import quote
+import requests
+
+from ..utils.file_utils import open_atomic
+
+# Use orjson's C parser/serializer when available
+try:
+    import orjson
+    json_loads = orjson.loads
+    json_dumps = orjson.dumps
+except ImportError:
+    import json
+    json_loads = json.loads
+    
+    def json_dumps(obj: Any) -> bytes:
+        """Serialize an object to JSON bytes."""
+        return json.dumps(obj).encode()
+
+logger = logging.getLogger(__name__)
+
+# Headers for requests with a JSON body
+JSON_HEADERS = {"Content-Type": "application/json"}
+
+# People lists are persisted here, keyed by server URL, so restarts can skip refetching them
+PEOPLE_CACHE_PATH = Path.home() / ".cache" / "hass-immich-addon" / "people.json"
+
+# Seconds a persisted people list stays valid
+PEOPLE_CACHE_TTL = 3600
+
+def _read_people_cache() -> Dict[str, Any]:
+    """Read the persisted people cache, treating a missing or corrupt file as empty."""
+    try:
+        cache = json_loads(PEOPLE_CACHE_PATH.read_bytes())
+    except (OSError, ValueError):
+        return {}
+    return cache if isinstance(cache, dict) else {}
+
+def _load_people_cache(base_url: str) -> Optional[Dict[str, str]]:
+    """
+    Get the persisted people list for a server if it is still fresh.
+    
+    Args:
+        base_url: Base URL of the Immich server
+        
+    Returns:
+        Dictionary mapping person names to their IDs, or None if not cached or expired
+    """
+    entry = _read_people_cache().get(base_url)
+    
+    # Anything not shaped like [timestamp, {name: id}] is treated as a miss so
+    # the next fetch rewrites it
+    try:
+        fetched_at, people_dict = entry
+        expired = time.time() - fetched_at >= PEOPLE_CACHE_TTL
+    except (TypeError, ValueError):
+        return None
+    if expired or not isinstance(people_dict, dict):
+        return None
+    return people_dict
+
+def _store_people_cache(base_url: str, people_dict: Dict[str, str]) -> None:
+    """
+    Persist the people list for a server, replacing the file atomically.
+    
+    Failing to write the cache is logged and otherwise ignored.
+    
+    Args:
+        base_url: Base URL of the Immich server
+        people_dict: Dictionary mapping person names to their IDs
+    """
+    cache = _read_people_cache()
+    cache[base_url] = (time.time(), people_dict)
+    try:
+        PEOPLE_CACHE_PATH.parent.mkdir(parents=True, exist_ok=True)
+        with open_atomic(PEOPLE_CACHE_PATH) as f:
+            f.write(json_dumps(cache))
+    except OSError as e:
+        logger.warning(f"Failed to write people cache {PEOPLE_CACHE_PATH}: {e}")
+
+class ImmichSession(Protocol):
+    """Protocol defining the required Immich session interface."""
+    def post(self, url: str, json: dict = None, data: bytes = None, headers: dict = None) -> any:
+        """Make a POST request to Immich API."""
+        ...
+        
+    def get(self, url: str) -> any:
+        """Make a GET request to Immich API."""
+        ...
+
+class ImmichAPI:
+    """Utility class for common Immich API operations."""
+    
+    def __init__(self, session: ImmichSession, base_url: str, people_ttl: float = 300):
+        """
+        Initialize the Immich API utility.
+        
+        Args:
+            session: Session object for making API requests, ideally from
+                immich.client.create_session so it has pooling and retries
+            base_url: Base URL of the Immich server
+            people_ttl: Seconds to reuse the people list before refetching it
+        """
+        self.session = session
+        self.base_url = base_url.rstrip('/')
+        self.people_ttl = people_ttl
+        self._people_cache: Optional[Tuple[float, Dict[str, str]]] = None
+        self._person_ids: Dict[str, Tuple[float, Optional[str]]] = {}
+        self._skip_disk_cache = False
+        
+    def post_json(self, url: str, body: Any) -> Any:
+        """
+        POST a JSON body to the Immich API and parse the JSON response.
+        
+        Args:
+            url: Full URL of the API endpoint
+            body: Request body to serialize as JSON
+            
+        Returns:
+            Parsed response body
+            
+        Raises:
+            requests.RequestException: If the API request fails
+        """
+        response = self.session.post(url, data=json_dumps(body), headers=JSON_HEADERS)
+        response.raise_for_status()
+        return json_loads(response.content)
+        
+    def get_people(self) -> Dict[str, str]:
+        """
+        Get all people from Immich and their IDs.
+        
+        Results are cached in memory for people_ttl seconds. The first call in
+        a process may instead use the list persisted on disk within the last
+        PEOPLE_CACHE_TTL seconds, so restarts don't refetch it; once that
+        expires from memory the list is always refetched from the server.
+        
+        Returns:
+            Dictionary mapping person names to their IDs
+        
+        Raises:
+            requests.RequestException: If the API request fails
+        """
+        if self._people_cache is not None:
+            fetched_at, people_dict = self._people_cache
+            if time.monotonic() - fetched_at < self.people_ttl:
+                return people_dict
+        
+        # Only fall back to the disk cache before anything has been loaded in this process
+        people_dict = None
+        if self._people_cache is None and not self._skip_disk_cache:
+            people_dict = _load_people_cache(self.base_url)
+        if people_dict is not None:
+            logger.debug(f"Using {len(people_dict)} people from {PEOPLE_CACHE_PATH}")
+            self._people_cache = (time.monotonic(), people_dict)
+            return people_dict
+        
+        response = self.session.get(f"{self.base_url}/api/people")
+        response.raise_for_status()
+        
+        people = json_loads(response.content)
+        people_dict = {person["name"]: person["id"] for person in people["people"]}
+
+        # Info level - high level summary
+        logger.info(f"Retrieved {len(people_dict)} people from Immich")
+             
+        # Debug level - detailed information about each person
+        #for name, id in people_dict.items():
+        #    logger.debug(f"Found person: {name} (ID: {id})")
+        
+        self._people_cache = (time.monotonic(), people_dict)
+        self._skip_disk_cache = False
+        _store_people_cache(self.base_url, people_dict)
+        return people_dict
+
+    def get_person_id(self, name: str) -> Optional[str]:
+        """
+        Resolve a single person's name to their ID.
+        
+        Searches Immich by name rather than fetching every person, falling back to
+        the full people list if the search finds no exact match or the search
+        endpoint isn't available. Results are cached for people_ttl seconds, or
+        until invalidate_people() is called.
+        
+        Args:
+            name: Name of the person to look up
+            
+        Returns:
+            The person's ID, or None if no person has that name
+        
+        Raises:
+            requests.RequestException: If the API request fails
+        """
+        cached = self._person_ids.get(name)
+        if cached is not None:
+            resolved_at, person_id = cached
+            if time.monotonic() - resolved_at < self.people_ttl:
+                return person_id
+            
+        person_id = None
+        try:
+            response = self.session.get(f"{self.base_url}/api/search/person?name={quote(name)}")
+            response.raise_for_status()
+            person_id = next(
+                (person["id"] for person in json_loads(response.content) if person["name"] == name),
+                None
+            )
+        except requests.HTTPError as e:
+            # Older servers may not have the search endpoint
+            logger.debug(f"Person search failed, using the full people list: {e}")
+            
+        if person_id is None:
+            person_id = self.get_people().get(name)
+            
+        self._person_ids[name] = (time.monotonic(), person_id)
+        return person_id
+
+    def invalidate_people(self) -> None:
+        """Discard the cached people list so the next call refetches it."""
+        self._people_cache = None
+        self._skip_disk_cache = True
+        self._person_ids.clear() 
\ No newline at end of file
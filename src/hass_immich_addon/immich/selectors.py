@@ -0,0 +1,315 @@
+"""
+Asset selection strategies for Immich.
+"""
+from abc import ABC, abstractmethod
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Tuple
+import logging
+from datetime import datetime
+from .immich_api import ImmichSession, ImmichAPI, json_dumps
+import random
+import time
+
+if TYPE_CHECKING:
+    from .client import AsyncImmichClient
+
+logger = logging.getLogger(__name__)
+
+def _build_body_template(city: Optional[str] = None,
+                         person_ids: Optional[List[str]] = None,
+                         taken_after: Optional[datetime] = None,
+                         taken_before: Optional[datetime] = None,
+                         **fields) -> Dict[str, Any]:
+    """
+    Build the parts of a search request body that don't change between calls.
+    
+    Args:
+        city: Optional city name to filter assets by location
+        person_ids: Optional list of person GUIDs to filter assets by people
+        taken_after: Optional datetime to filter assets taken after this time
+        taken_before: Optional datetime to filter assets taken before this time
+        **fields: Additional fields to include in the body
+        
+    Returns:
+        Request body containing only the specified filters
+    """
+    body = {"type": "IMAGE", **fields}
+    
+    # Only add filters if they are specified
+    if taken_after:
+        body["takenAfter"] = taken_after.isoformat()
+    if taken_before:
+        body["takenBefore"] = taken_before.isoformat()
+    if person_ids:
+        body["personIds"] = person_ids
+    if city:
+        body["city"] = city
+        
+    return body
+
+class AssetSelector(ABC):
+    """
+    Abstract base class for asset selection strategies.
+    
+    Strategies describe their search request and how to pick asset IDs from the
+    response, so the same selector can be driven by the blocking session or by
+    an AsyncImmichClient. Selectors keep a session even when only driven
+    asynchronously so they remain usable with the blocking
+    ImmichClient.get_assets and get_assets_multi.
+    
+    Setting cache_ttl to a positive number of seconds reuses the last search
+    response for identical requests made within that window, which deflects
+    bursts of refreshes. Selection from a cached response still runs per call.
+    """
+    
+    api: ImmichAPI
+    cache_ttl: float = 0
+    _cached_response: Optional[Tuple[float, Tuple[str, bytes], Any]] = None
+    
+    def _cache_lookup(self, url: str, body: Dict[str, Any]) -> Optional[Any]:
+        """Get a cached response for the request if caching is enabled and it is still fresh."""
+        if self.cache_ttl <= 0 or self._cached_response is None:
+            return None
+        cached_at, key, response_data = self._cached_response
+        if key != (url, json_dumps(body)) or time.monotonic() - cached_at >= self.cache_ttl:
+            return None
+        logger.debug(f"Using cached response for {url}")
+        return response_data
+
+    def _cache_store(self, url: str, body: Dict[str, Any], response_data: Any) -> None:
+        """Remember a response for the request if caching is enabled."""
+        if self.cache_ttl > 0:
+            self._cached_response = (time.monotonic(), (url, json_dumps(body)), response_data)
+    
+    def get_assets(self, count: int = 5) -> List[str]:
+        """
+        Get a list of asset IDs using the implemented strategy.
+        
+        Args:
+            count: Number of assets to retrieve
+            
+        Returns:
+            List of asset IDs
+            
+        Raises:
+            requests.RequestException: If the API request fails
+        """
+        url, body = self.build_request(count)
+        response_data = self._cache_lookup(url, body)
+        if response_data is None:
+            response_data = self.api.post_json(url, body)
+            self._cache_store(url, body, response_data)
+        return self.parse_response(response_data, count)
+
+    async def get_assets_async(self, client: 'AsyncImmichClient', count: int = 5) -> List[str]:
+        """
+        Get a list of asset IDs using the implemented strategy without blocking.
+        
+        Args:
+            client: Async client to send the search request with
+            count: Number of assets to retrieve
+            
+        Returns:
+            List of asset IDs
+            
+        Raises:
+            httpx.HTTPError: If the API request fails
+        """
+        url, body = self.build_request(count)
+        response_data = self._cache_lookup(url, body)
+        if response_data is None:
+            response_data = await client.post_json(url, body)
+            self._cache_store(url, body, response_data)
+        return self.parse_response(response_data, count)
+
+    @abstractmethod
+    def build_request(self, count: int) -> Tuple[str, Dict[str, Any]]:
+        """
+        Build the search request for the given number of assets.
+        
+        Args:
+            count: Number of assets to retrieve
+            
+        Returns:
+            Tuple of the endpoint URL and the JSON request body
+        """
+        pass
+
+    @abstractmethod
+    def parse_response(self, response_data: Any, count: int) -> List[str]:
+        """
+        Pick asset IDs out of a search response.
+        
+        Args:
+            response_data: Parsed JSON response from the search endpoint
+            count: Number of assets requested
+            
+        Returns:
+            List of asset IDs
+        """
+        pass
+
+class RandomAssetSelector(AssetSelector):
+    """Selects random assets from Immich."""
+    
+    def __init__(self, 
+                 session: ImmichSession, 
+                 base_url: str, 
+                 city: Optional[str] = None, 
+                 person_ids: Optional[List[str]] = None,
+                 taken_after: Optional[datetime] = None,
+                 taken_before: Optional[datetime] = None):
+        """
+        Initialize the random asset selector.
+        
+        Args:
+            session: Session object for making API requests
+            base_url: Base URL of the Immich server
+            city: Optional city name to filter assets by location
+            person_ids: Optional list of person GUIDs to filter assets by people
+            taken_after: Optional datetime to filter assets taken after this time
+            taken_before: Optional datetime to filter assets taken before this time
+        """
+        self.api = ImmichAPI(session, base_url)
+        self.city = city
+        self.person_ids = person_ids
+        self.taken_after = taken_after
+        self.taken_before = taken_before
+        self._endpoint = f"{self.api.base_url}/api/search/random"
+        self._body_template = _build_body_template(city, person_ids, taken_after, taken_before)
+        
+    def build_request(self, count: int) -> Tuple[str, Dict[str, Any]]:
+        """Build a random search request for the given number of assets."""
+        logger.debug(f"Getting {count} assets")
+        
+        request_body = {**self._body_template, "size": count}
+        return self._endpoint, request_body
+
+    def parse_response(self, response_data: Any, count: int) -> List[str]:
+        """Get asset IDs from a random search response."""
+        asset_ids = [item["id"] for item in response_data]
+        logger.info(f"Successfully retrieved {len(asset_ids)} random asset IDs")
+        return asset_ids
+
+class SmartSearchAssetSelector(AssetSelector):
+    """Selects assets using Immich's smart search functionality."""
+    
+    def __init__(self, 
+                 session: ImmichSession, 
+                 base_url: str,
+                 search_query: str,
+                 city: Optional[str] = None, 
+                 person_ids: Optional[List[str]] = None,
+                 taken_after: Optional[datetime] = None,
+                 taken_before: Optional[datetime] = None):
+        """
+        Initialize the smart search asset selector.
+        
+        Args:
+            session: Session object for making API requests
+            base_url: Base URL of the Immich server
+            search_query: The search query to find relevant assets
+            city: Optional city name to filter assets by location
+            person_ids: Optional list of person GUIDs to filter assets by people
+            taken_after: Optional datetime to filter assets taken after this time
+            taken_before: Optional datetime to filter assets taken before this time
+        """
+        self.api = ImmichAPI(session, base_url)
+        self.search_query = search_query
+        self.city = city
+        self.person_ids = person_ids
+        self.taken_after = taken_after
+        self.taken_before = taken_before
+        self._endpoint = f"{self.api.base_url}/api/search/smart"
+        self._body_template = _build_body_template(
+            city, person_ids, taken_after, taken_before, query=search_query
+        )
+        
+    def build_request(self, count: int) -> Tuple[str, Dict[str, Any]]:
+        """Build a smart search request for up to the given number of assets."""
+        logger.debug(f'Getting up to {count} assets matching "{self.search_query}"')
+        
+        request_body = {**self._body_template, "size": count}
+        return self._endpoint, request_body
+
+    def parse_response(self, response_data: Any, count: int) -> List[str]:
+        """Get asset IDs from the assets and albums sections of a smart search response."""
+        items = (response_data.get("assets") or {}).get("items") or ()
+        album_items = (response_data.get("albums") or {}).get("items") or ()
+        
+        # Get asset IDs from the assets section, then any assets in matching albums
+        asset_ids = [item["id"] for item in items]
+        asset_ids += [asset["id"] for album in album_items for asset in album.get("assets", ())]
+        
+        logger.info(f'Successfully retrieved {len(asset_ids)} assets matching "{self.search_query}"')
+        return asset_ids
+
+class RandomSmartSearchAssetSelector(AssetSelector):
+    """Selects random assets from smart search results in Immich."""
+    
+    def __init__(self, 
+                 session: ImmichSession, 
+                 base_url: str,
+                 search_query: str,
+                 max_search_results: int = 250,
+                 city: Optional[str] = None, 
+                 person_ids: Optional[List[str]] = None,
+                 taken_after: Optional[datetime] = None,
+                 taken_before: Optional[datetime] = None):
+        """
+        Initialize the random smart search asset selector.
+        
+        Args:
+            session: Session object for making API requests
+            base_url: Base URL of the Immich server
+            search_query: The search query to find relevant assets
+            max_search_results: Maximum number of search results to fetch for randomization (1-1000)
+            city: Optional city name to filter assets by location
+            person_ids: Optional list of person GUIDs to filter assets by people
+            taken_after: Optional datetime to filter assets taken after this time
+            taken_before: Optional datetime to filter assets taken before this time
+        """
+        self.api = ImmichAPI(session, base_url)
+        self.search_query = search_query
+        self.max_search_results = max_search_results
+        self.city = city
+        self.person_ids = person_ids
+        self.taken_after = taken_after
+        self.taken_before = taken_before
+        
+        self._endpoint = f"{self.api.base_url}/api/search/smart"
+        
+        # The search size is fixed, so the whole request body can be built once
+        self._request_body = _build_body_template(
+            city, person_ids, taken_after, taken_before,
+            query=search_query, size=max_search_results
+        )
+        
+    def build_request(self, count: int) -> Tuple[str, Dict[str, Any]]:
+        """Build the smart search request whose results are sampled from."""
+        logger.debug(f'Getting up to {self.max_search_results} assets matching "{self.search_query}" then randomly selecting {count}')
+        
+        return self._endpoint, self._request_body
+
+    def parse_response(self, response_data: Any, count: int) -> List[str]:
+        """Randomly select the given number of asset IDs from a smart search response."""
+        # Collect unique asset IDs from the assets and albums sections; order
+        # doesn't matter since the selection below is random
+        items = (response_data.get("assets") or {}).get("items") or ()
+        album_items = (response_data.get("albums") or {}).get("items") or ()
+        asset_id_set = {item["id"] for item in items}
+        asset_id_set.update(asset["id"] for album in album_items for asset in album.get("assets", ()))
+        
+        unique_asset_ids = list(asset_id_set)
+        
+        logger.info(f'Found {len(unique_asset_ids)} total assets matching "{self.search_query}"')
+        
+        # Randomly select the requested number of assets
+        if len(unique_asset_ids) <= count:
+            # If we have fewer or equal assets than requested, return all
+            selected_asset_ids = unique_asset_ids
+        else:
+            # Randomly sample the requested count
+            selected_asset_ids = random.sample(unique_asset_ids, count)
+        
+        logger.info(f'Randomly selected {len(selected_asset_ids)} assets from search results')
+        return selected_asset_ids 
\ No newline at end of file
@@ -2,19 +2,10 @@
 Main application entry point.
 """
 import logging
-import os
-import sys
 import asyncio
-from pathlib import Path
 
-# Add the parent directory to Python path for local development
-if os.path.basename(os.getcwd()) == 'src':
-    sys.path.append(os.path.dirname(os.getcwd()))
-else:
-    sys.path.append(os.getcwd())
-
-from config import load_config
-from photo_updater import PhotoUpdater
+from .config import load_config
+from .photo_updater import PhotoUpdater
 
 async def main():
     """Main entry point for the application."""
@@ -34,5 +25,9 @@ async def main():
     updater = PhotoUpdater(config)
     await updater.run()
 
+def run():
+    """Console script entry point."""
+    asyncio.run(main())
+
 if __name__ == "__main__":
-    asyncio.run(main()) 
\ No newline at end of file
+    run() 
\ No newline at end of file
@@ -2,25 +2,21 @@
 PhotoUpdater module for managing periodic photo updates from Immich.
 """
 import logging
-import os
 import signal
 import asyncio
+import time
 from datetime import datetime, timedelta
+from typing import Dict, Tuple
 
-import requests
-
-from config.schema import AppConfig, PhotoFilters
-from immich.client import ImmichClient, ImmichConfig
-from immich.selectors import RandomAssetSelector, SmartSearchAssetSelector, RandomSmartSearchAssetSelector, AssetSelector
-from immich.immich_api import ImmichAPI
-from utils import (
-    save_binary_data, 
-    extract_zip, 
+from .config.schema import AppConfig, PhotoFilters
+from .immich.client import AsyncImmichClient, ImmichClient, ImmichConfig
+from .immich.selectors import RandomAssetSelector, SmartSearchAssetSelector, RandomSmartSearchAssetSelector, AssetSelector
+from .utils import (
     cleanup_file, 
     process_media_files,
     cleanup_directory
 )
-from utils.media_utils import (
+from .utils.media_utils import (
     SUPPORTED_IMAGE_FORMATS,
     SUPPORTED_VIDEO_FORMATS,
     HEIC_FORMATS
@@ -28,6 +24,9 @@ from utils.media_utils import (
 
 logger = logging.getLogger(__name__)
 
+# Extensions of every media file the updater writes, cleared before each update
+_MEDIA_EXTS = frozenset(SUPPORTED_IMAGE_FORMATS + SUPPORTED_VIDEO_FORMATS + HEIC_FORMATS)
+
 class PhotoUpdater:
     def __init__(self, config: AppConfig):
         self.config = config
@@ -41,36 +40,69 @@ class PhotoUpdater:
             api_key=config.immich.api_key
         )
         
-        # Create and configure session with API key
-        self.session = requests.Session()
-        self.session.headers.update({
-            "x-api-key": config.immich.api_key,
-            "Accept": "application/json",
-            "Content-Type": "application/json"
-        })
+        # Share one client, and so one session and connection pool, for all blocking
+        # requests. Only person lookups use it: they run once per filter set in a
+        # worker thread and ImmichAPI caches the results. Searches and downloads
+        # go through the async client below.
+        self.client = ImmichClient.shared(immich_config)  # Selector will be set per update
+        self.session = self.client.session
 
-        # Get list of people from Immich
-        self.api = ImmichAPI(self.session, config.immich.url)
-        self.people = self.api.get_people()
+        # People are resolved to IDs lazily, per filter
+        self.api = self.client.api
+        
+        # Searches and downloads go through a non-blocking client, created on first use
+        self._immich_config = immich_config
+        self.async_client = None
         
-        # Create the base client
-        self.client = ImmichClient(immich_config, None)  # Selector will be set per update
+        # Selectors are built once per filter set and reused across updates until
+        # the people they were built with may have changed
+        self._selector_cache: Dict[PhotoFilters, Tuple[float, AssetSelector]] = {}
         
         logger.info(f"Initialized with {len(config.filters)} filter sets:")
         for filter_set in config.filters:
             logger.info(f"  {filter_set}")
 
+    async def _ensure_client(self) -> AsyncImmichClient:
+        """Get the non-blocking Immich client, creating it inside the running event loop."""
+        if self.async_client is None:
+            self.async_client = AsyncImmichClient(self._immich_config)
+        return self.async_client
+
+    def _get_selector_for_filter(self, filter_set: PhotoFilters) -> AssetSelector:
+        """Get the cached asset selector for the given filter set, creating it if needed."""
+        cached = self._selector_cache.get(filter_set)
+        if cached is not None:
+            created_at, selector = cached
+            if not filter_set.people or time.monotonic() - created_at < self.api.people_ttl:
+                return selector
+                
+        selector = self._create_selector_for_filter(filter_set)
+        selector.cache_ttl = self.config.search_cache_ttl
+        # Don't keep selectors whose people couldn't all be resolved, so the
+        # lookup is retried next time
+        if not filter_set.people or selector.person_ids:
+            self._selector_cache[filter_set] = (time.monotonic(), selector)
+        return selector
+
+    def refresh_people(self) -> None:
+        """Refetch people from Immich on next use and rebuild selectors that depend on them."""
+        self.api.invalidate_people()
+        self._selector_cache.clear()
+
     def _create_selector_for_filter(self, filter_set: PhotoFilters) -> AssetSelector:
         """Create an asset selector for the given filter set."""
         # Get person IDs for filtered people if specified
         person_ids = None
         if filter_set.people:
-            try:
-                person_ids = [self.people[name] for name in filter_set.people]
+            resolved_ids = [self.api.get_person_id(name) for name in filter_set.people]
+            missing = [name for name, person_id in zip(filter_set.people, resolved_ids) if person_id is None]
+            if missing:
+                logger.warning(f"Person not found in Immich: {', '.join(missing)}")
+                if logger.isEnabledFor(logging.DEBUG):
+                    logger.debug("Available people: %s", list(self.api.get_people().keys()))
+            else:
+                person_ids = resolved_ids
                 logger.debug(f"Using person IDs: {person_ids} for people: {filter_set.people}")
-            except KeyError as e:
-                logger.warning(f"Person not found in Immich: {e}")
-                logger.debug("Available people: %s", list(self.people.keys()))
         
         # Common parameters for both selector types
         selector_params = {
@@ -103,41 +135,32 @@ class PhotoUpdater:
         logger.info(f"Updating photos using {current_filter}")
         
         try:
-            # Update selector for current filter set
-            self.client.asset_selector = self._create_selector_for_filter(current_filter)
+            # Update selector for current filter set; resolving people may block
+            # on the network, so keep it off the event loop like the file work below
+            client = await self._ensure_client()
+            selector = await asyncio.to_thread(self._get_selector_for_filter, current_filter)
             
             # Clean up existing media files
             logger.info("Cleaning up existing media files...")
-            cleanup_directory(
-                self.config.hass_img_path,
-                file_types=SUPPORTED_IMAGE_FORMATS + SUPPORTED_VIDEO_FORMATS + HEIC_FORMATS
-            )
+            await asyncio.to_thread(cleanup_directory, self.config.hass_img_path, file_types=_MEDIA_EXTS)
             
             # Get asset IDs using the configured selector
             logger.info(f"Fetching {self.config.num_photos} photos...")
-            asset_ids = self.client.get_assets(count=self.config.num_photos)
+            asset_ids = await client.get_assets(selector, count=self.config.num_photos)
             
-            # Download the assets
+            # Download the original files concurrently
             logger.info(f"Downloading {len(asset_ids)} photos...")
-            data = self.client.download_assets(asset_ids)
-            
-            # Save the downloaded archive
-            archive_path = os.path.join(self.config.hass_img_path, "photos.zip")
-            save_binary_data(data, archive_path)
+            downloaded_files = await client.download_assets_parallel(asset_ids, self.config.hass_img_path)
             
-            # Extract photos from the archive
-            extracted_files = extract_zip(archive_path, self.config.hass_img_path)
-            logger.info(f"Extracted {len(extracted_files)} files")
-            
-            # Process the extracted files (convert HEIC to JPG/MP4)
-            processed_files = process_media_files(extracted_files, self.config.hass_img_path)
+            # Process the downloaded files (convert HEIC to JPG/MP4)
+            processed_files, originals_to_delete = await asyncio.to_thread(
+                process_media_files, downloaded_files, self.config.hass_img_path, self.config.max_image_dimension
+            )
             logger.info(f"Processed {len(processed_files)} media files")
             
-            # Clean up the ZIP file and original HEIC files
-            cleanup_file(archive_path)
-            for file in extracted_files:
-                if file not in processed_files:  # Only delete original if it was converted
-                    cleanup_file(file)
+            # Clean up the original HEIC files
+            for file in originals_to_delete:
+                cleanup_file(file)
                     
             self.last_update = datetime.now()
             logger.info(f"Photo update completed successfully. You should now see photos for {current_filter}.")
@@ -149,11 +172,6 @@ class PhotoUpdater:
             
         except Exception as e:
             logger.error(f"Error updating photos: {e}", exc_info=True)
-            # Attempt to clean up ZIP file if it exists
-            try:
-                cleanup_file(archive_path)
-            except Exception:
-                pass  # Ignore cleanup errors in error handler
 
     async def run(self):
         """Run the photo updater in a continuous loop"""
@@ -179,6 +197,11 @@ class PhotoUpdater:
                 logger.error(f"Unexpected error in update loop: {e}", exc_info=True)
                 # Sleep for 1 minute before retrying on error
                 await asyncio.sleep(60)
+                
+        # Release pooled connections on shutdown
+        if self.async_client is not None:
+            await self.async_client.close()
+            self.async_client = None
     
     def _signal_handler(self, signum, frame):
         """Handle shutdown signals"""
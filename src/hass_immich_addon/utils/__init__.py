@@ -0,0 +1,22 @@
+"""
+Utility package for file and media operations.
+
+Media helpers are imported on first use, so modules that only need the file
+helpers don't pull in Pillow, pillow-heif and ffmpeg.
+"""
+from .file_utils import open_atomic, cleanup_file, cleanup_directory
+
+__all__ = [
+    'open_atomic',
+    'cleanup_file',
+    'cleanup_directory',
+    'process_media_files',
+    'process_media_file'
+]
+
+def __getattr__(name: str):
+    """Import media helpers lazily."""
+    if name in ('process_media_files', 'process_media_file'):
+        from . import media_utils
+        return getattr(media_utils, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -0,0 +1,108 @@
+"""
+Utility functions for file I/O operations.
+"""
+import logging
+import os
+from contextlib import contextmanager, suppress
+from typing import IO, Iterable, Iterator, Optional
+
+logger = logging.getLogger(__name__)
+
+@contextmanager
+def open_atomic(filepath: str, mode: str = 'wb', tmp_dir: Optional[str] = None,
+                **kwargs) -> Iterator[IO]:
+    """
+    Open a file for writing that only appears under its name once complete.
+    
+    Data is written to a ".part" sibling, synced to disk, and then renamed
+    over the target, so readers and crashes never see a partial file. If the
+    block raises, the partial file is removed.
+    
+    Args:
+        filepath: Path where the file should end up
+        mode: Write mode for open(), 'wb' or 'w'
+        tmp_dir: Directory for the ".part" file instead of the target's own;
+            must be on the same filesystem as the target
+        **kwargs: Additional arguments for open()
+        
+    Yields:
+        File object for the temporary file
+        
+    Raises:
+        OSError: If the file cannot be written or renamed
+    """
+    tmp_path = os.fspath(filepath) + '.part'
+    if tmp_dir is not None:
+        tmp_path = os.path.join(tmp_dir, os.path.basename(tmp_path))
+    try:
+        with open(tmp_path, mode, **kwargs) as f:
+            yield f
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, filepath)
+    except BaseException:
+        with suppress(FileNotFoundError):
+            os.unlink(tmp_path)
+        raise
+
+def cleanup_directory(directory: str, file_types: Optional[Iterable[str]] = None) -> None:
+    """
+    Delete all files of specified types in a directory.
+    
+    Args:
+        directory: Path to the directory to clean
+        file_types: File extensions to delete (e.g., ['.jpg', '.mp4']). Pass a
+                   frozenset of lowercase extensions to skip converting it per call.
+                   If None, deletes all files.
+        
+    Raises:
+        OSError: If directory cannot be accessed or files cannot be deleted
+    """
+    if not os.path.exists(directory):
+        logger.warning(f"Directory {directory} does not exist")
+        return
+        
+    # Match extensions with a set lookup rather than scanning a sequence per file
+    if file_types is not None and not isinstance(file_types, (set, frozenset)):
+        file_types = frozenset(t.lower() for t in file_types)
+        
+    try:
+        # scandir gets the file type from the directory listing, avoiding a stat per file
+        with os.scandir(directory) as entries:
+            for entry in entries:
+                if not entry.is_file(follow_symlinks=False):
+                    continue
+                    
+                # If file_types is specified, only delete matching extensions
+                if file_types is not None:
+                    _, dot, ext = entry.name.rpartition('.')
+                    if not dot or ('.' + ext).lower() not in file_types:
+                        continue
+                        
+                cleanup_file(entry.path)
+            
+        logger.info(f"Successfully cleaned directory: {directory}")
+        
+    except OSError as e:
+        logger.error(f"Failed to clean directory {directory}: {e}", exc_info=True)
+        raise
+
+def cleanup_file(filepath: str) -> None:
+    """
+    Delete a file if it exists.
+    
+    Args:
+        filepath: Path to the file to delete
+        
+    Raises:
+        OSError: If file cannot be deleted
+    """
+    try:
+        # Let unlink report a missing file rather than checking first
+        os.unlink(filepath)
+        logger.info(f"Successfully deleted {filepath}")
+    except FileNotFoundError:
+        pass
+    except OSError as e:
+        logger.error(f"Failed to delete file {filepath}: {e}", exc_info=True)
+        raise 
\ No newline at end of file
@@ -0,0 +1,295 @@
+"""
+Utilities for media file conversion and processing.
+"""
+import logging
+import multiprocessing
+import os
+from contextlib import suppress
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from typing import Iterable, List, Optional, Set, Tuple
+import ffmpeg
+from PIL import Image
+import pillow_heif
+
+logger = logging.getLogger(__name__)
+
+# Register HEIF opener with Pillow
+pillow_heif.register_heif_opener()
+
+# Supported image and video formats
+SUPPORTED_IMAGE_FORMATS = ('.jpg', '.jpeg', '.png', '.gif', '.webp')
+SUPPORTED_VIDEO_FORMATS = ('.mov', '.mp4')
+HEIC_FORMATS = ('.heic', '.heif')
+
+# Encode converted videos as H.264/AAC, which every browser can play in MP4
+_MP4_CODECS = {"vcodec": "libx264", "acodec": "aac"}
+
+# How process_media_file handles each supported extension
+_ROUTE = {
+    **{ext: 'pass' for ext in SUPPORTED_IMAGE_FORMATS + SUPPORTED_VIDEO_FORMATS},
+    **{ext: 'heic' for ext in HEIC_FORMATS},
+}
+
+# Conversions run in worker processes started without forking, since the
+# caller typically has other threads (event loop, HTTP client) that fork would copy
+_MP_CONTEXT = multiprocessing.get_context(
+    "forkserver" if "forkserver" in multiprocessing.get_all_start_methods() else "spawn"
+)
+
+def _route(input_path: str) -> Tuple[Optional[str], str]:
+    """Get how a file should be handled ('pass', 'heic' or None if unsupported) and its lowercase extension."""
+    _, dot, ext = os.path.basename(input_path).rpartition('.')
+    ext = dot + ext.lower() if dot else ''
+    return _ROUTE.get(ext), ext
+
+def convert_heic_to_jpg(input_path: str, output_dir: str, max_dimension: Optional[int] = None) -> str:
+    """
+    Convert a HEIC image file to JPG format.
+    
+    Args:
+        input_path: Path to the input HEIC file
+        output_dir: Directory to save the converted JPG
+        max_dimension: Optional maximum length of the longest side; larger images
+            are scaled down to fit, keeping their aspect ratio
+        
+    Returns:
+        Path to the converted JPG file
+        
+    Raises:
+        OSError: If file operations fail
+        Image.UnidentifiedImageError: If image format is not supported
+    """
+    try:
+        # Generate output path with jpg extension
+        filename = os.path.splitext(os.path.basename(input_path))[0] + '.jpg'
+        output_path = os.path.join(output_dir, filename)
+        
+        # Decode with pillow-heif directly rather than through Pillow's plugin lookup
+        try:
+            heif_file = pillow_heif.open_heif(input_path, convert_hdr_to_8bit=True)
+        except (ValueError, RuntimeError) as e:
+            # Not a HEIF image, e.g. a video; let the caller try other conversions
+            raise Image.UnidentifiedImageError(f"Cannot identify HEIF image {input_path}: {e}") from e
+            
+        with heif_file.to_pillow() as img:
+            # Scale down to fit; thumbnail() does a cheap integer reduce before resampling
+            if max_dimension:
+                img.thumbnail((max_dimension, max_dimension))
+                
+            # Convert to RGB, compositing onto white only if there is alpha
+            if img.mode == 'RGB':
+                pass
+            elif img.mode in ('RGBA', 'LA'):
+                background = Image.new('RGB', img.size, (255, 255, 255))
+                background.paste(img, mask=img.split()[-1])
+                img = background
+            else:
+                img = img.convert('RGB')
+            
+            # Save as JPEG
+            img.save(output_path, 'JPEG', quality=95)
+            
+        logger.info(f"Converted {input_path} to {output_path}")
+        return output_path
+        
+    except Exception as e:
+        logger.error(f"Failed to convert {input_path} to JPG: {e}", exc_info=True)
+        raise
+
+def convert_heic_video_to_mp4(input_path: str, output_dir: str) -> str:
+    """
+    Convert a HEIC video file to MP4 format using ffmpeg.
+    
+    Args:
+        input_path: Path to the input HEIC video file
+        output_dir: Directory to save the converted MP4
+        
+    Returns:
+        Path to the converted MP4 file
+        
+    Raises:
+        ffmpeg.Error: If conversion fails
+    """
+    try:
+        # Generate output path with mp4 extension
+        filename = os.path.splitext(os.path.basename(input_path))[0] + '.mp4'
+        output_path = os.path.join(output_dir, filename)
+        
+        # Convert using ffmpeg
+        stream = ffmpeg.input(input_path)
+        stream = ffmpeg.output(stream, output_path, **_MP4_CODECS)
+        ffmpeg.run(stream, capture_stdout=True, capture_stderr=True, overwrite_output=True)
+        
+        logger.info(f"Converted {input_path} to {output_path}")
+        return output_path
+        
+    except ffmpeg.Error as e:
+        logger.error(f"Failed to convert {input_path} to MP4: {e.stderr.decode()}", exc_info=True)
+        # Don't leave a truncated video behind to be served
+        with suppress(FileNotFoundError):
+            os.unlink(output_path)
+        raise
+
+def convert_heic_videos_to_mp4(input_paths: List[str], output_dir: str) -> List[str]:
+    """
+    Convert several HEIC video files to MP4 format with a single ffmpeg run.
+    
+    One process handles the whole batch, using the same codecs as
+    convert_heic_video_to_mp4. If the batch fails, its outputs are removed and
+    each file is converted on its own so one bad file doesn't lose the rest.
+    
+    Args:
+        input_paths: Paths to the input HEIC video files
+        output_dir: Directory to save the converted MP4s
+        
+    Returns:
+        Paths to the converted MP4 files
+    """
+    if not input_paths:
+        return []
+        
+    output_paths = [
+        os.path.join(output_dir, os.path.splitext(os.path.basename(input_path))[0] + '.mp4')
+        for input_path in input_paths
+    ]
+    
+    try:
+        # One output per input, all written by the same ffmpeg process
+        outputs = [
+            ffmpeg.output(ffmpeg.input(input_path), output_path, **_MP4_CODECS)
+            for input_path, output_path in zip(input_paths, output_paths)
+        ]
+        ffmpeg.run(
+            ffmpeg.merge_outputs(*outputs),
+            capture_stdout=True, capture_stderr=True, overwrite_output=True
+        )
+        
+        logger.info(f"Converted {len(input_paths)} HEIC videos to MP4")
+        return output_paths
+        
+    except Exception as e:
+        details = e.stderr.decode() if isinstance(e, ffmpeg.Error) else e
+        logger.warning(f"Batch MP4 conversion failed, converting files individually: {details}")
+        
+    # Remove anything the failed batch wrote before retrying file by file
+    for output_path in output_paths:
+        with suppress(FileNotFoundError):
+            os.unlink(output_path)
+        
+    converted_paths = []
+    for input_path in input_paths:
+        try:
+            converted_paths.append(convert_heic_video_to_mp4(input_path, output_dir))
+        except Exception as e:
+            # ffmpeg errors are already logged, carry on with the other files
+            if not isinstance(e, ffmpeg.Error):
+                logger.error(f"Failed to convert {input_path} to MP4: {e}", exc_info=True)
+    return converted_paths
+
+def process_media_file(input_path: str, output_dir: str, max_dimension: Optional[int] = None,
+                       convert_videos: bool = True) -> Optional[Tuple[str, Optional[str]]]:
+    """
+    Process a media file, converting if necessary based on its type.
+    
+    Args:
+        input_path: Path to the input media file
+        output_dir: Directory to save the processed file
+        max_dimension: Optional maximum length of the longest side of converted images
+        convert_videos: Whether to convert HEIC videos here; if False they are
+            left for the caller to batch
+        
+    Returns:
+        Tuple of the path to the processed file and the input path if it was
+        converted (so the original can be deleted) or None if it was kept as is.
+        None instead of a tuple for a HEIC video left unconverted.
+        
+    Raises:
+        ValueError: If file type is not supported
+    """
+    # Get file extension (lowercase) and how to handle it
+    route, ext = _route(input_path)
+    
+    if route == 'heic':
+        try:
+            # Try image conversion first
+            return convert_heic_to_jpg(input_path, output_dir, max_dimension), input_path
+        except Image.UnidentifiedImageError:
+            # If it fails as an image, try video conversion
+            if not convert_videos:
+                return None
+            return convert_heic_video_to_mp4(input_path, output_dir), input_path
+    elif route == 'pass':
+        # Already in supported format, just return the path
+        return input_path, None
+    else:
+        raise ValueError(f"Unsupported file type: {ext}")
+
+def process_media_files(input_files: Iterable[str], output_dir: str,
+                        max_dimension: Optional[int] = None) -> Tuple[List[str], Set[str]]:
+    """
+    Process multiple media files, converting them if necessary.
+    
+    Files already in a supported format are resolved inline; only HEIC files
+    are sent to worker processes. HEIC videos are collected and converted
+    together once the images are done.
+    
+    Args:
+        input_files: Paths to input media files
+        output_dir: Directory to save the processed files
+        max_dimension: Optional maximum length of the longest side of converted images
+        
+    Returns:
+        Tuple of the paths to the processed files and the set of input files
+        that should be deleted, either because they were converted or because
+        they could not be processed
+    """
+    processed_files = []
+    originals_to_delete = set()
+    heic_files = []
+    heic_videos = []
+    
+    for input_file in input_files:
+        route, ext = _route(input_file)
+        if route == 'heic':
+            heic_files.append(input_file)
+        elif route == 'pass':
+            processed_files.append(input_file)
+        else:
+            logger.error(f"Failed to process {input_file}: Unsupported file type: {ext}")
+            originals_to_delete.add(input_file)
+            
+    if not heic_files:
+        return processed_files, originals_to_delete
+    
+    # Conversions are CPU-bound, so run them across all cores
+    with ProcessPoolExecutor(max_workers=min(os.cpu_count() or 1, len(heic_files)),
+                             mp_context=_MP_CONTEXT) as executor:
+        futures = {
+            executor.submit(process_media_file, input_file, output_dir, max_dimension, False): input_file
+            for input_file in heic_files
+        }
+        for future in as_completed(futures):
+            input_file = futures[future]
+            try:
+                result = future.result()
+            except Exception as e:
+                logger.error(f"Failed to process {input_file}: {e}", exc_info=True)
+                # Continue processing other files even if one fails
+                originals_to_delete.add(input_file)
+                continue
+                
+            if result is None:
+                heic_videos.append(input_file)
+                continue
+                
+            processed_file, converted_input = result
+            processed_files.append(processed_file)
+            if converted_input is not None:
+                originals_to_delete.add(converted_input)
+    
+    # Convert all HEIC videos with one ffmpeg process; their originals are not
+    # kept whether or not conversion succeeded
+    processed_files.extend(convert_heic_videos_to_mp4(heic_videos, output_dir))
+    originals_to_delete.update(heic_videos)
+    
+    return processed_files, originals_to_delete 
\ No newline at end of file
@@ -1,14 +0,0 @@
-"""
-Utility package for file and media operations.
-"""
-from .file_utils import save_binary_data, extract_zip, cleanup_file, cleanup_directory
-from .media_utils import process_media_files, process_media_file
-
-__all__ = [
-    'save_binary_data',
-    'extract_zip',
-    'cleanup_file',
-    'cleanup_directory',
-    'process_media_files',
-    'process_media_file'
-] 
\ No newline at end of file